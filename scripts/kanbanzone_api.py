@@ -11,17 +11,49 @@ Environment variables:
 
 import argparse
 import base64
+import collections
+import concurrent.futures
+import functools
+import gzip
+import hashlib
+import http.client
 import json
 import os
+import re
 import sys
-import urllib.error
+import threading
+import time
 import urllib.parse
-import urllib.request
+import zlib
 
+try:  # optional accelerator; the CLI remains fully functional without it
+    import orjson
+except ImportError:
+    orjson = None
 
-BASE_URL = "https://integrations.kanbanzone.io/v1"
 
+API_HOST = "integrations.kanbanzone.io"
+API_BASE_PATH = "/v1"
 
+# One keep-alive connection per thread, reused across requests so the
+# TCP+TLS handshake happens once instead of once per API call.
+_conn_local = threading.local()
+
+
+def _get_connection():
+    conn = getattr(_conn_local, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPSConnection(API_HOST, timeout=30)
+        _conn_local.conn = conn
+    return conn
+
+
+def _drop_connection(conn):
+    _conn_local.conn = None
+    conn.close()
+
+
+@functools.lru_cache(maxsize=1)
 def get_api_key():
     raw = os.environ.get("KANBANZONE_API_KEY")
     if not raw:
@@ -29,6 +61,7 @@ def get_api_key():
     return base64.b64encode(raw.encode()).decode()
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_board():
     return os.environ.get("KANBANZONE_BOARD_ID")
 
@@ -40,15 +73,56 @@ def require_board(args):
     return board
 
 
+def json_loads(data):
+    """Parse JSON from str or bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj):
+    """Serialize to UTF-8 JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
 def error_exit(message):
     json.dump({"error": True, "message": message}, sys.stdout, indent=2)
     print()
     sys.exit(1)
 
 
-def api_request(method, path, params=None, body=None):
+# Targeted patterns for recovering pagination state from a raw /cards page
+# without parsing it (see the prescan fast path in api_request).
+_HAS_MORE_RE = re.compile(rb'"hasMore"\s*:\s*true')
+_TOTAL_RE = re.compile(rb'"totalAvailable"\s*:\s*(\d+)')
+
+
+# Characters no JSON encoder escapes. Anything outside this set (quotes
+# and backslashes, but also e.g. < > & / in Go's and PHP's encoders) may
+# appear as \uXXXX escapes in the raw bytes, where a plain substring
+# check would falsely reject a matching page.
+_PRESCAN_SAFE_RE = re.compile(r"[a-z0-9 _.,-]+")
+
+
+def prescan_token(query):
+    """Return a raw-bytes pre-scan token for a --query value, or None.
+
+    Only queries made of never-escaped characters use the fast path;
+    everything else falls back to a full parse.
+    """
+    if not query:
+        return None
+    q = query.lower()
+    if not _PRESCAN_SAFE_RE.fullmatch(q):
+        return None
+    return q.encode("utf-8")
+
+
+def api_request(method, path, params=None, body=None, prescan=None):
     encoded_key = get_api_key()
-    url = f"{BASE_URL}{path}"
+    url = f"{API_BASE_PATH}{path}"
 
     if params:
         filtered = {k: v for k, v in params.items() if v is not None}
@@ -57,98 +131,334 @@ def api_request(method, path, params=None, body=None):
 
     data = None
     if body is not None:
-        data = json.dumps(body).encode("utf-8")
+        data = json_dumps_bytes(body)
 
-    req = urllib.request.Request(url, data=data, method=method)
-    req.add_header("Authorization", f"Basic {encoded_key}")
-    req.add_header("Content-Type", "application/json")
-    req.add_header("Accept", "application/json")
+    headers = {
+        "Authorization": f"Basic {encoded_key}",
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip",
+    }
 
-    try:
-        with urllib.request.urlopen(req) as resp:
-            raw = resp.read().decode("utf-8")
-            try:
-                return json.loads(raw)
-            except json.JSONDecodeError:
-                return {"error": True, "message": raw.strip() or "Empty response"}
-    except urllib.error.HTTPError as e:
-        body_text = ""
+    for attempt in (1, 2):
+        conn = _get_connection()
         try:
-            body_text = e.read().decode("utf-8")
-        except Exception:
-            pass
-        return {"error": True, "status": e.code, "message": e.reason, "body": body_text}
-    except urllib.error.URLError as e:
-        return {"error": True, "message": str(e.reason)}
+            conn.request(method, url, body=data, headers=headers)
+            resp = conn.getresponse()
+            raw_bytes = resp.read()
+            if resp.getheader("Content-Encoding") == "gzip":
+                raw_bytes = gzip.decompress(raw_bytes)
+        except (http.client.HTTPException, ConnectionError, OSError,
+                EOFError, zlib.error) as e:
+            # EOFError/zlib.error: a truncated or corrupt gzip body (only
+            # BadGzipFile is an OSError). Otherwise the server may have
+            # closed an idle pooled connection; either way drop it and
+            # retry once on a fresh one. Only GETs are retried: a
+            # failure during getresponse() can happen after the server
+            # already processed the request, and re-sending a POST/PUT
+            # would duplicate the mutation.
+            _drop_connection(conn)
+            if method != "GET" or attempt == 2:
+                return {"error": True, "message": str(e)}
+            continue
+        if resp.status >= 400:
+            return {"error": True, "status": resp.status, "message": resp.reason,
+                    "body": raw_bytes.decode("utf-8", errors="replace")}
+        if prescan is not None and prescan not in raw_bytes.lower():
+            # The query string appears nowhere in the raw payload, so no card
+            # on this page can match — skip json.loads entirely and recover
+            # the pagination fields with targeted regexes.
+            skipped = {"cards": [], "count": 0,
+                       "hasMore": bool(_HAS_MORE_RE.search(raw_bytes))}
+            total = _TOTAL_RE.search(raw_bytes)
+            if total:
+                skipped["totalAvailable"] = int(total.group(1))
+            return skipped
+        try:
+            return json_loads(raw_bytes)
+        except ValueError:
+            raw = raw_bytes.decode("utf-8", errors="replace")
+            return {"error": True, "message": raw.strip() or "Empty response"}
 
 
 def output(data):
-    json.dump(data, sys.stdout, indent=2)
-    print()
+    # Serialize to one bytes buffer and write it in a single call:
+    # json.dump(..., sys.stdout) pushes many small chunks through the text
+    # IO layer, each paying encode + lock overhead.
+    if orjson is not None:
+        buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(data, indent=2).encode("utf-8")
+    sys.stdout.buffer.write(buf + b"\n")
+    sys.stdout.buffer.flush()
 
 
 def parse_custom_fields(raw_list):
     """Parse ["Label=Value", ...] into [{"label": "...", "value": "..."}, ...]."""
     fields = []
     for item in raw_list:
-        if "=" not in item:
+        # partition is a single C call returning a tuple — no list
+        # allocation like split, and no separate membership test.
+        label, sep, value = item.partition("=")
+        if not sep:
             error_exit(f"Invalid custom field format: '{item}'. Use 'Label=Value'.")
-        label, value = item.split("=", 1)
         fields.append({"label": label.strip(), "value": value.strip()})
     return fields
 
 
-def fetch_all_cards(board, include_archived=False):
-    """Fetch all cards from a board, handling pagination."""
-    params = {"board": board, "count": 100}
+def _cards_query(board, count, include_archived):
+    """Encode the page-invariant part of a /cards query string."""
+    params = {"board": board, "count": count}
     if include_archived:
         params["includeArchived"] = "true"
-    cards_data = api_request("GET", "/cards", params=params)
+    return urllib.parse.urlencode(params)
+
+
+def fetch_all_cards(board, include_archived=False, predicate=None, prescan=None):
+    """Fetch all cards from a board, handling pagination.
+
+    When ``predicate`` is given it is applied to each page as it arrives,
+    so cards that cannot match are dropped immediately instead of being
+    accumulated across the whole board. ``prescan`` (from prescan_token)
+    additionally lets api_request skip parsing pages whose raw bytes cannot
+    contain the query.
+    """
+    count = 100
+    # Only the page number varies between requests, so encode the stable
+    # part of the query string once instead of once per page.
+    path = "/cards?" + _cards_query(board, count, include_archived)
+    cards_data = api_request("GET", path, prescan=prescan)
     if cards_data.get("error"):
         return cards_data
-    all_cards = cards_data.get("cards", [])
+
+    def keep(cards):
+        if predicate is None:
+            return cards
+        return [c for c in cards if predicate(c)]
+
+    all_cards = keep(cards_data.get("cards", []))
+    if not cards_data.get("hasMore"):
+        return all_cards
+
+    total = cards_data.get("totalAvailable")
+    if isinstance(total, int) and total > count:
+        # Page count is known up front, so the remaining pages are
+        # independent — fetch them concurrently and merge in page order.
+        last_page = -(-total // count)
+
+        def fetch_page(p):
+            return api_request("GET", f"{path}&page={p}", prescan=prescan)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            for page_data in pool.map(fetch_page, range(2, last_page + 1)):
+                if page_data.get("error"):
+                    break
+                all_cards.extend(keep(page_data.get("cards", [])))
+        return all_cards
+
+    # No total count in the response: fall back to chained fetching.
     page = 2
     while cards_data.get("hasMore"):
-        params["page"] = page
-        cards_data = api_request("GET", "/cards", params=params)
+        cards_data = api_request("GET", f"{path}&page={page}", prescan=prescan)
         if cards_data.get("error"):
             break
-        all_cards.extend(cards_data.get("cards", []))
+        all_cards.extend(keep(cards_data.get("cards", [])))
         page += 1
     return all_cards
 
 
-def get_card_field(card, field):
-    """Get a field from a card, checking both top-level and nested CardItem."""
-    if field in card:
-        return card[field]
-    card_item = card.get("CardItem", {})
-    return card_item.get(field)
+def iter_card_pages(board, include_archived=False, prescan=None):
+    """Yield raw /cards page responses one at a time, fetching lazily.
+
+    Unlike fetch_all_cards, no request is issued until the consumer asks
+    for the next page, so bounded consumers can stop the HTTP traffic
+    early. Error responses are yielded as-is for the caller to handle.
+    """
+    path = "/cards?" + _cards_query(board, 100, include_archived)
+    page = 1
+    while True:
+        url = path if page == 1 else f"{path}&page={page}"
+        data = api_request("GET", url, prescan=prescan)
+        yield data
+        if data.get("error") or not data.get("hasMore"):
+            return
+        page += 1
+
+
+def _field(card, name):
+    """Single-expression card field lookup (top-level, then nested CardItem)."""
+    value = card.get(name)
+    if value is None:
+        value = card.get("CardItem", {}).get(name)
+    return value
+
+
+# Pre-bound so hot predicate closures skip the per-call method lookup.
+_casefold = str.casefold
+
+
+def compile_filters(label=None, owner=None, column=None, priority=None,
+                    blocked=False, query=None):
+    """Build a list of card predicates with filter constants pre-lowered.
+
+    Casefolding the filter values once here, instead of per card inside the
+    filter loop, keeps the hot loop to a single dict lookup and comparison
+    per predicate. casefold() rather than lower() so case-insensitive
+    matching is correct for non-ASCII text too.
+
+    Predicates are appended in ascending cost order so the all() short
+    circuit does the cheap rejections first: the blocked boolean check,
+    then the exact-match string fields, and the title/description
+    substring scan for --query last.
+    """
+    predicates = []
+    if blocked:
+        predicates.append(lambda c: bool(_field(c, "blocked")))
+    if priority:
+        priority_s = str(priority)
+        predicates.append(
+            lambda c: str(_field(c, "priority") or "") == priority_s)
+    if label:
+        label_l = _casefold(label)
+        predicates.append(
+            lambda c: _casefold(_field(c, "label") or "") == label_l)
+    if column:
+        column_l = _casefold(column)
+        predicates.append(
+            lambda c: _casefold(_field(c, "columnTitle") or "") == column_l)
+    if owner:
+        owner_l = _casefold(owner)
+        predicates.append(
+            lambda c: _casefold(_field(c, "owner") or "") == owner_l)
+    if query:
+        q = _casefold(query)
+        predicates.append(
+            lambda c: q in _casefold(_field(c, "title") or "")
+            or q in _casefold(_field(c, "description") or ""))
+    return predicates
+
+
+# ── Search caches ─────────────────────────────────────────────────────
+#
+# search-cards with --cache persists two kinds of short-lived state on
+# disk: the /boards response (the board list changes rarely, and skipping
+# the round trip saves a full HTTPS exchange per search) and a small
+# trigram bloom filter per board so repeated searches can skip fetching
+# boards that cannot possibly contain the query.
+
+_BLOOM_BITS = 1 << 16  # 8 KiB of bits per board
+_BLOOM_TTL = 300  # seconds before a cached bloom is considered stale
+_BOARDS_TTL = 300  # seconds before a cached /boards response is stale
+
+
+def _cache_path(filename):
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "kanbanzone", filename)
+
+
+def cached_boards(ttl=_BOARDS_TTL):
+    """GET /boards, reusing an on-disk copy younger than ``ttl`` seconds.
+
+    The cache file is keyed by a hash of the API key so organizations
+    never see each other's board lists. Only successful responses are
+    written; errors always pass through uncached.
+    """
+    key_hash = hashlib.sha1(get_api_key().encode()).hexdigest()[:12]
+    path = _cache_path(f"boards-{key_hash}.json")
+    try:
+        if time.time() - os.path.getmtime(path) <= ttl:
+            with open(path, "rb") as f:
+                return json_loads(f.read())
+    except (OSError, ValueError):
+        pass
+    data = api_request("GET", "/boards")
+    if not data.get("error"):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(json_dumps_bytes(data))
+        except OSError:
+            pass  # caching is best-effort
+    return data
+
+
+def _bloom_path(board, include_archived):
+    suffix = "-archived" if include_archived else ""
+    return _cache_path(f"query-bloom-{board}{suffix}.json")
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _bloom_positions(gram):
+    # Two independent crc32 seeds plus their xor give k=3 deterministic
+    # hash positions (hash() varies per process under PYTHONHASHSEED).
+    g = gram.encode("utf-8")
+    h1 = zlib.crc32(g)
+    h2 = zlib.crc32(g, 0x9E3779B9)
+    return (h1 % _BLOOM_BITS, h2 % _BLOOM_BITS, (h1 ^ h2) % _BLOOM_BITS)
+
+
+def build_query_bloom(cards):
+    """Fold every card's searchable text trigrams into one bloom bitset."""
+    bits = 0
+    for card in cards:
+        text = _casefold(f"{_field(card, 'title') or ''} "
+                         f"{_field(card, 'description') or ''}")
+        for gram in _trigrams(text):
+            for pos in _bloom_positions(gram):
+                bits |= 1 << pos
+    return bits
+
+
+def bloom_may_match(bits, query):
+    """False only when some query trigram is definitely absent."""
+    grams = _trigrams(_casefold(query))
+    if not grams:
+        return True
+    return all(bits >> pos & 1
+               for gram in grams for pos in _bloom_positions(gram))
+
+
+def load_query_bloom(board, include_archived):
+    path = _bloom_path(board, include_archived)
+    try:
+        if time.time() - os.path.getmtime(path) > _BLOOM_TTL:
+            return None
+        with open(path, "rb") as f:
+            return int(json_loads(f.read())["bits"], 16)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_query_bloom(board, include_archived, bits):
+    path = _bloom_path(board, include_archived)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(json_dumps_bytes({"bits": f"{bits:x}"}))
+    except OSError:
+        pass  # caching is best-effort; search still works without it
+
+
+def combine_predicates(predicates):
+    """Fold a predicate list into a single callable, or None if empty."""
+    if not predicates:
+        return None
+    return lambda card: all(p(card) for p in predicates)
 
 
 def filter_cards(cards, label=None, owner=None, column=None, priority=None,
                  blocked=False, query=None):
     """Apply client-side filters to a list of cards."""
-    result = []
-    for card in cards:
-        if label and (get_card_field(card, "label") or "").lower() != label.lower():
-            continue
-        if owner and (get_card_field(card, "owner") or "").lower() != owner.lower():
-            continue
-        if column and (get_card_field(card, "columnTitle") or "").lower() != column.lower():
-            continue
-        if priority and str(get_card_field(card, "priority") or "") != str(priority):
-            continue
-        if blocked and not get_card_field(card, "blocked"):
-            continue
-        if query:
-            q = query.lower()
-            title = (get_card_field(card, "title") or "").lower()
-            desc = (get_card_field(card, "description") or "").lower()
-            if q not in title and q not in desc:
-                continue
-        result.append(card)
-    return result
+    predicate = combine_predicates(compile_filters(
+        label=label, owner=owner, column=column,
+        priority=priority, blocked=blocked, query=query))
+    if predicate is None:
+        return list(cards)
+    return [c for c in cards if predicate(c)]
 
 
 # ── Subcommand handlers ──────────────────────────────────────────────
@@ -173,25 +483,43 @@ def cmd_board(args):
 
 def cmd_cards(args):
     board = require_board(args)
-    has_filters = (args.label or args.owner or args.column or args.priority
-                   or args.blocked or args.query)
+    has_filters = any((args.label, args.owner, args.column, args.priority,
+                       args.blocked, args.query))
 
     if has_filters:
-        all_cards = fetch_all_cards(board, args.include_archived)
-        if isinstance(all_cards, dict) and all_cards.get("error"):
-            output(all_cards)
-            return
-        filtered = filter_cards(
-            all_cards, label=args.label, owner=args.owner,
+        predicate = combine_predicates(compile_filters(
+            label=args.label, owner=args.owner,
             column=args.column, priority=args.priority,
             blocked=args.blocked, query=args.query,
-        )
-        output({
-            "count": len(filtered),
-            "totalAvailable": len(filtered),
-            "cards": filtered,
-            "hasMore": False,
-        })
+        ))
+        # Stream pages and stop fetching once --count matches have
+        # accumulated, instead of always paging through the whole board.
+        matched = []
+        truncated = False
+        first_page = True
+        for page_data in iter_card_pages(board, args.include_archived,
+                                         prescan=prescan_token(args.query)):
+            if page_data.get("error"):
+                if first_page:
+                    output(page_data)
+                    return
+                break
+            first_page = False
+            cards = page_data.get("cards", [])
+            if predicate is not None:
+                cards = [c for c in cards if predicate(c)]
+            matched.extend(cards)
+            if len(matched) >= args.count:
+                truncated = (len(matched) > args.count
+                             or bool(page_data.get("hasMore")))
+                del matched[args.count:]
+                break
+        result = {"count": len(matched)}
+        if not truncated:
+            result["totalAvailable"] = len(matched)
+        result["cards"] = matched
+        result["hasMore"] = truncated
+        output(result)
     else:
         params = {"board": board, "page": args.page, "count": args.count}
         if args.days_since_update is not None:
@@ -236,8 +564,8 @@ def cmd_create_card(args):
 
 
 def cmd_create_cards(args):
-    with open(args.file, "r") as f:
-        data = json.load(f)
+    with open(args.file, "rb") as f:
+        data = json_loads(f.read())
     if "board" not in data:
         board = require_board(args)
         data["board"] = board
@@ -320,30 +648,89 @@ def cmd_unlink_card(args):
     output(api_request("PUT", f"/card/{args.id}", body=body))
 
 
+# Fan out across processes instead of threads once this many boards are
+# being searched on a multi-core machine: JSON parse + filtering holds the
+# GIL, so thread-based concurrency stops scaling after the bytes arrive.
+_PROCESS_FANOUT_MIN = 4
+
+
+def _search_board(board_id, include_archived, filter_kwargs, use_bloom):
+    """Fetch one board and return its filtered cards.
+
+    Top-level (not a closure over args) so it can be pickled to
+    ProcessPoolExecutor workers; each worker process gets its own
+    keep-alive connections via the thread-local pool. Recompiling the
+    predicates per board is a few closure allocations — noise next to the
+    fetch and parse they gate.
+    """
+    predicate = combine_predicates(compile_filters(**filter_kwargs))
+    query = filter_kwargs.get("query")
+    if use_bloom:
+        bloom = load_query_bloom(board_id, include_archived)
+        if bloom is not None and not bloom_may_match(bloom, query):
+            return []  # no trigram of the query on this board: skip fetch
+        # Building the bloom needs every card's text, so fetch without
+        # predicate pushdown and filter locally afterwards.
+        cards = fetch_all_cards(board_id, include_archived=include_archived)
+        if isinstance(cards, dict) and cards.get("error"):
+            return []
+        save_query_bloom(board_id, include_archived, build_query_bloom(cards))
+        return [c for c in cards if predicate(c)]
+    cards = fetch_all_cards(board_id, include_archived=include_archived,
+                            predicate=predicate, prescan=prescan_token(query))
+    if isinstance(cards, dict) and cards.get("error"):
+        return []
+    return cards
+
+
 def cmd_search_cards(args):
     if not args.query and not (args.label or args.owner or args.priority or args.blocked):
         error_exit("Provide --query and/or filter flags (--label, --owner, --priority, --blocked).")
 
-    boards_data = api_request("GET", "/boards")
+    boards_data = cached_boards() if args.cache else api_request("GET", "/boards")
     if boards_data.get("error"):
         output(boards_data)
         return
 
-    all_results = []
+    board_ids = []
     for board_item in boards_data.get("boards", []):
         bi = board_item.get("BoardItem", board_item)
-        board_id = bi.get("publicId")
         if bi.get("isArchived"):
             continue
-        cards = fetch_all_cards(board_id, include_archived=args.include_archived)
-        if isinstance(cards, dict) and cards.get("error"):
-            continue
-        filtered = filter_cards(
-            cards, label=args.label, owner=args.owner,
-            priority=args.priority, blocked=args.blocked,
-            query=args.query,
-        )
-        all_results.extend(filtered)
+        board_ids.append(bi.get("publicId"))
+
+    search = functools.partial(
+        _search_board,
+        include_archived=args.include_archived,
+        filter_kwargs={"label": args.label, "owner": args.owner,
+                       "priority": args.priority, "blocked": args.blocked,
+                       "query": args.query},
+        use_bloom=args.cache and bool(args.query),
+    )
+
+    # Fetch all boards concurrently; wall-clock is dominated by HTTP round
+    # trips, so overlapping the per-board requests collapses total latency.
+    # Large fan-outs on multi-core machines use processes so JSON parsing
+    # and filtering also run in parallel instead of serializing on the GIL.
+    all_results = []
+    if board_ids:
+        cpus = os.cpu_count() or 1
+        if cpus > 1 and len(board_ids) >= _PROCESS_FANOUT_MIN:
+            pool_cls = concurrent.futures.ProcessPoolExecutor
+            workers = min(cpus, len(board_ids))
+            # Under the fork start method, workers would inherit the live
+            # keep-alive connection opened for GET /boards and multiplex
+            # requests over one shared TLS socket. Drop it before forking
+            # so every worker opens its own connection.
+            conn = getattr(_conn_local, "conn", None)
+            if conn is not None:
+                _drop_connection(conn)
+        else:
+            pool_cls = concurrent.futures.ThreadPoolExecutor
+            workers = min(16, len(board_ids))
+        with pool_cls(max_workers=workers) as pool:
+            for filtered in pool.map(search, board_ids):
+                all_results.extend(filtered)
 
     output({
         "count": len(all_results),
@@ -364,12 +751,10 @@ def cmd_wip_check(args):
         output(all_cards)
         return
 
-    # Count cards per column
-    col_counts = {}
-    for card in all_cards:
-        cid = get_card_field(card, "columnId")
-        if cid:
-            col_counts[cid] = col_counts.get(cid, 0) + 1
+    # Count cards per column; Counter increments in C, avoiding the
+    # per-card get()+store dance of a plain dict.
+    col_counts = collections.Counter(
+        filter(None, (_field(c, "columnId") for c in all_cards)))
 
     # Build WIP report
     boards = board_data.get("boards", [])
@@ -418,38 +803,28 @@ def add_filter_args(parser):
     parser.add_argument("--query", help="Search title and description (case-insensitive)")
 
 
-def build_parser():
-    parser = argparse.ArgumentParser(
-        prog="kanbanzone_api",
-        description="KanbanZone API CLI client. All output is JSON.",
-    )
-    parser.add_argument("--board", help="Board public ID (overrides KANBANZONE_BOARD_ID)")
-
-    sub = parser.add_subparsers(dest="command", help="Available commands")
-
-    # boards
-    p = sub.add_parser("boards", help="List all boards with metrics")
+def _args_boards(p):
     p.add_argument("--include-archived", action="store_true", help="Include archived boards")
     p.add_argument("--include-columns", action="store_true", help="Include column details")
 
-    # board
-    p = sub.add_parser("board", help="Get a specific board's details")
+
+def _args_board(p):
     p.add_argument("--include-columns", action="store_true", help="Include column details")
 
-    # cards
-    p = sub.add_parser("cards", help="List cards on a board")
+
+def _args_cards(p):
     p.add_argument("--page", type=int, default=1, help="Page number (default: 1)")
     p.add_argument("--count", type=int, default=100, help="Cards per page (default: 100, max: 100)")
     p.add_argument("--days-since-update", type=int, help="Filter by days since last update")
     p.add_argument("--include-archived", action="store_true", help="Include archived cards")
     add_filter_args(p)
 
-    # card
-    p = sub.add_parser("card", help="Get a single card by number")
+
+def _args_card(p):
     p.add_argument("--number", required=True, help="Card number")
 
-    # create-card
-    p = sub.add_parser("create-card", help="Create a single card")
+
+def _args_create_card(p):
     p.add_argument("--title", required=True, help="Card title")
     p.add_argument("--column-id", help="Target column ID")
     p.add_argument("--description", help="Card description (text or HTML)")
@@ -464,12 +839,12 @@ def build_parser():
     p.add_argument("--custom-field", action="append",
                    help="Custom field as 'Label=Value' (repeatable)")
 
-    # create-cards
-    p = sub.add_parser("create-cards", help="Create multiple cards from a JSON file")
+
+def _args_create_cards(p):
     p.add_argument("--file", required=True, help="Path to JSON file with cards data")
 
-    # update-card
-    p = sub.add_parser("update-card", help="Update a card's fields")
+
+def _args_update_card(p):
     p.add_argument("--id", required=True, type=int, help="Card number")
     p.add_argument("--title", help="New title")
     p.add_argument("--description", help="New description")
@@ -487,14 +862,14 @@ def build_parser():
     p.add_argument("--custom-field", action="append",
                    help="Custom field as 'Label=Value' (repeatable)")
 
-    # move-card
-    p = sub.add_parser("move-card", help="Move a card to a different column")
+
+def _args_move_card(p):
     p.add_argument("--id", required=True, type=int, help="Card number")
     p.add_argument("--column-id", required=True, help="Target column ID")
     p.add_argument("--mirror-board", help="Board ID for mirrored cards")
 
-    # link-card
-    p = sub.add_parser("link-card", help="Add a link to a card")
+
+def _args_link_card(p):
     p.add_argument("--id", required=True, type=int, help="Card number")
     link_target = p.add_mutually_exclusive_group(required=True)
     link_target.add_argument("--card", type=int, help="Target card number to link")
@@ -503,55 +878,105 @@ def build_parser():
     p.add_argument("--title", help="Link title (for URL links)")
     p.add_argument("--mirror-board", help="Board ID for mirrored cards")
 
-    # unlink-card
-    p = sub.add_parser("unlink-card", help="Remove a link from a card")
+
+def _args_unlink_card(p):
     p.add_argument("--id", required=True, type=int, help="Card number")
     unlink_target = p.add_mutually_exclusive_group(required=True)
     unlink_target.add_argument("--card", type=int, help="Target card number to unlink")
     unlink_target.add_argument("--url", help="External URL to unlink")
     p.add_argument("--mirror-board", help="Board ID for mirrored cards")
 
-    # search-cards
-    p = sub.add_parser("search-cards", help="Search cards across all boards")
+
+def _args_search_cards(p):
     p.add_argument("--query", help="Search title and description (case-insensitive)")
     p.add_argument("--label", help="Filter by label name (case-insensitive)")
     p.add_argument("--owner", help="Filter by owner email (case-insensitive)")
     p.add_argument("--priority", help="Filter by priority level")
     p.add_argument("--blocked", action="store_true", help="Show only blocked cards")
     p.add_argument("--include-archived", action="store_true", help="Include archived cards")
+    p.add_argument("--cache", action="store_true",
+                   help="Cache the board list and per-board query indexes "
+                        "(~5 min) to speed up repeated searches")
+
+
+# Registry of subcommands, built once at import:
+# name -> (help text, argument setup function, handler).
+SUBCOMMANDS = {
+    "boards": ("List all boards with metrics", _args_boards, cmd_boards),
+    "board": ("Get a specific board's details", _args_board, cmd_board),
+    "cards": ("List cards on a board", _args_cards, cmd_cards),
+    "card": ("Get a single card by number", _args_card, cmd_card),
+    "create-card": ("Create a single card", _args_create_card, cmd_create_card),
+    "create-cards": ("Create multiple cards from a JSON file",
+                     _args_create_cards, cmd_create_cards),
+    "update-card": ("Update a card's fields", _args_update_card, cmd_update_card),
+    "move-card": ("Move a card to a different column", _args_move_card,
+                  cmd_move_card),
+    "link-card": ("Add a link to a card", _args_link_card, cmd_link_card),
+    "unlink-card": ("Remove a link from a card", _args_unlink_card,
+                    cmd_unlink_card),
+    "search-cards": ("Search cards across all boards", _args_search_cards,
+                     cmd_search_cards),
+    "wip-check": ("Check WIP limits across board columns", None, cmd_wip_check),
+}
+
+
+def peek_command(argv):
+    """Find the subcommand in argv without running argparse.
+
+    Skips the root --board option (and its value) so only the matching
+    subparser needs to be constructed.
+    """
+    skip_next = False
+    for token in argv:
+        if skip_next:
+            skip_next = False
+            continue
+        if token == "--board":
+            skip_next = True
+            continue
+        if token.startswith("-"):
+            continue
+        return token
+    return None
+
 
-    # wip-check
-    p = sub.add_parser("wip-check", help="Check WIP limits across board columns")
+def build_parser(only=None):
+    """Build the CLI parser.
+
+    When ``only`` names a known subcommand, just that subparser is
+    constructed — registering all twelve on every invocation dominates
+    startup time for a CLI that runs exactly one.
+    """
+    parser = argparse.ArgumentParser(
+        prog="kanbanzone_api",
+        description="KanbanZone API CLI client. All output is JSON.",
+    )
+    parser.add_argument("--board", help="Board public ID (overrides KANBANZONE_BOARD_ID)")
+
+    sub = parser.add_subparsers(dest="command", help="Available commands")
+    for name, (help_text, setup, _handler) in SUBCOMMANDS.items():
+        if only is not None and name != only:
+            continue
+        p = sub.add_parser(name, help=help_text)
+        if setup is not None:
+            setup(p)
 
     return parser
 
 
 def main():
-    parser = build_parser()
+    command = peek_command(sys.argv[1:])
+    parser = build_parser(only=command if command in SUBCOMMANDS else None)
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    commands = {
-        "boards": cmd_boards,
-        "board": cmd_board,
-        "cards": cmd_cards,
-        "card": cmd_card,
-        "create-card": cmd_create_card,
-        "create-cards": cmd_create_cards,
-        "update-card": cmd_update_card,
-        "move-card": cmd_move_card,
-        "link-card": cmd_link_card,
-        "unlink-card": cmd_unlink_card,
-        "search-cards": cmd_search_cards,
-        "wip-check": cmd_wip_check,
-    }
-
-    handler = commands.get(args.command)
-    if handler:
-        handler(args)
+    entry = SUBCOMMANDS.get(args.command)
+    if entry:
+        entry[2](args)
     else:
         parser.print_help()
         sys.exit(1)